@@ -1,14 +1,19 @@
 from __future__ import annotations
+from typing import List
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 from src.models.request import DCFRequest
-from src.models.response import DCFResponse
+from src.models.response import DCFResponse, _round_half_up
 from src.services.dcf_calculation_service import DCFCalculationService
 
 router = APIRouter(prefix="/dcf")
 
+# The service is stateless; share one instance instead of allocating per request.
+_SERVICE = DCFCalculationService()
 
-@router.post('/calculate', response_model=DCFResponse)
-async def calculate(payload: DCFRequest):
+
+@router.post('/calculate', response_class=ORJSONResponse, responses={200: {"model": DCFResponse}})
+def calculate(payload: DCFRequest):
     """Calculate DCF and return values.
 
     Units and conventions:
@@ -18,16 +23,17 @@ async def calculate(payload: DCFRequest):
     - `starting_fcf` is the last historical year's FCF; the first forecast FCF (FCF1) = starting_fcf * (1 + fcf_growth_rate).
     """
 
-    service = DCFCalculationService()
     try:
-        result = service.calculate_dcf(payload)
-        response = DCFResponse(
-            enterprise_value=result.enterprise_value,
-            equity_value=result.equity_value,
-            discounted_fcfs=result.discounted_fcfs,
-            discounted_terminal_value=result.discounted_terminal_value,
-        )
-        return response
+        result = _SERVICE.calculate_dcf(payload)
+        # The result values are trusted internal floats; round in plain
+        # Python and return them directly — no response-model re-validation.
+        payload_out = {
+            'enterprise_value': _round_half_up(result.enterprise_value),
+            'equity_value': _round_half_up(result.equity_value),
+            'discounted_fcfs': [_round_half_up(x) for x in result.discounted_fcfs],
+            'discounted_terminal_value': _round_half_up(result.discounted_terminal_value),
+        }
+        return ORJSONResponse(payload_out)
     except ValueError as exc:
         # Expect error messages prefixed with an error code like "WACC_LE_G: ..."
         msg = str(exc)
@@ -36,3 +42,25 @@ async def calculate(payload: DCFRequest):
             'error': msg,
             'error_code': error_code,
         })
+
+
+@router.post('/calculate_batch', response_class=ORJSONResponse, responses={200: {"model": List[DCFResponse]}})
+def calculate_batch(payloads: List[DCFRequest]):
+    """Calculate DCF for a batch of scenarios in one call.
+
+    Same units and conventions as `/dcf/calculate`. Intended for
+    sensitivity analysis across rates/growths: all scenarios are
+    evaluated by a single parallel kernel call, and results are returned
+    in request order.
+    """
+
+    results = _SERVICE.calculate_dcf_batch(payloads)
+    return ORJSONResponse([
+        {
+            'enterprise_value': _round_half_up(r.enterprise_value),
+            'equity_value': _round_half_up(r.equity_value),
+            'discounted_fcfs': [_round_half_up(x) for x in r.discounted_fcfs],
+            'discounted_terminal_value': _round_half_up(r.discounted_terminal_value),
+        }
+        for r in results
+    ])
@@ -1,10 +1,13 @@
 from __future__ import annotations
-import json
 import sys
+import orjson
 from src.models.request import DCFRequest
 from src.services.dcf_calculation_service import DCFCalculationService
 from src.models.response import DCFResponse
 
+# Stateless service; one shared instance is enough.
+svc = DCFCalculationService()
+
 
 def main():
     # Simple CLI: read JSON payload from stdin or first arg
@@ -13,7 +16,7 @@ def main():
     else:
         raw = sys.stdin.read()
     try:
-        payload = json.loads(raw)
+        payload = orjson.loads(raw)
     except Exception as e:
         print('Invalid JSON input:', e)
         sys.exit(2)
@@ -24,16 +27,16 @@ def main():
         print('Validation error:', e)
         sys.exit(2)
 
-    svc = DCFCalculationService()
     try:
         res = svc.calculate_dcf(req)
-        resp = DCFResponse(
+        # Trusted internal values: skip response-side validation.
+        resp = DCFResponse.model_construct(
             enterprise_value=res.enterprise_value,
             equity_value=res.equity_value,
             discounted_fcfs=res.discounted_fcfs,
             discounted_terminal_value=res.discounted_terminal_value,
         )
-        print(json.dumps(resp.model_dump(), indent=2))
+        print(orjson.dumps(resp.model_dump(), option=orjson.OPT_INDENT_2).decode())
     except ValueError as e:
         print('Calculation error:', str(e))
         sys.exit(3)
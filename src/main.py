@@ -1,9 +1,9 @@
 from __future__ import annotations
 from fastapi import FastAPI
-from fastapi.responses import RedirectResponse
+from fastapi.responses import ORJSONResponse, RedirectResponse
 from src.api.controllers import router as dcf_router
 
-app = FastAPI(title='DCF Analysis Agent', version='0.0.1')
+app = FastAPI(title='DCF Analysis Agent', version='0.0.1', default_response_class=ORJSONResponse)
 app.include_router(dcf_router)
 
 
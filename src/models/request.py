@@ -5,6 +5,8 @@ from pydantic import BaseModel, Field, field_validator, model_validator, compute
 
 class DCFRequest(BaseModel):
     model_config = ConfigDict(
+        extra='forbid',
+        frozen=True,
         json_schema_extra={
             "example": {
                 "starting_fcf": 72.764,
@@ -24,7 +26,8 @@ class DCFRequest(BaseModel):
     terminal_growth_rate: Optional[float] = Field(None, description="Terminal (perpetuity) growth rate (percent). Example: 3.0 = 3%")
     net_debt: Optional[float] = Field(None, description="Net debt in billions. Positive = net debt; negative = net cash")
     
-    _fcf_list: List[float] = PrivateAttr()
+    _fcf_list: Optional[List[float]] = PrivateAttr(default=None)
+    _last_fcf: float = PrivateAttr(default=0.0)
 
     @field_validator('starting_fcf')
     def validate_starting_fcf(cls, v: float):
@@ -69,21 +72,27 @@ class DCFRequest(BaseModel):
             raise ValueError('G_GTE_DISCOUNT_RATE: terminal_growth_rate must be strictly less than discount_rate')
         return self
 
-    @model_validator(mode='after')
-    def compute_fcf_list(self):
-        """Generate FCF list based on starting_fcf, fcf_growth_rate, and years."""
-        fcf_list = []
-        growth_factor = 1.0 + (self.fcf_growth_rate / 100.0)
-        for year in range(1, self.years + 1):
-            fcf = self.starting_fcf * (growth_factor ** year)
-            fcf_list.append(fcf)
-        self._fcf_list = fcf_list
-        return self
+    def _materialize_fcf(self) -> List[float]:
+        """Build and memoize the forecast FCF list on first access.
+
+        Validation-only paths never pay for the list; the cumulative
+        multiplier avoids a `**` call per year.
+        """
+        if self._fcf_list is None:
+            growth_factor = 1.0 + (self.fcf_growth_rate / 100.0)
+            cur = self.starting_fcf
+            fcf_list = []
+            for _ in range(self.years):
+                cur *= growth_factor
+                fcf_list.append(cur)
+            self._fcf_list = fcf_list
+            self._last_fcf = cur
+        return self._fcf_list
 
     @computed_field
     def fcf(self) -> List[float]:
         """Computed FCF list derived from starting_fcf, fcf_growth_rate, and years."""
-        return self._fcf_list
+        return self._materialize_fcf()
 
     @computed_field
     def terminal_value(self) -> float:
@@ -96,10 +105,15 @@ class DCFRequest(BaseModel):
         if self.terminal_growth_rate is None:
             return 0.0
         
-        last_fcf = self.fcf[-1]
+        self._materialize_fcf()
+        last_fcf = self._last_fcf
         wacc = self.discount_rate / 100.0
         g = self.terminal_growth_rate / 100.0
         
         tv = last_fcf * (1.0 + g) / (wacc - g)
         return tv
 
+
+# Compile the validator schema at import so the first request does not pay
+# the lazy-build cost.
+DCFRequest.model_rebuild(force=True)
@@ -0,0 +1,22 @@
+from __future__ import annotations
+import os
+import uvicorn
+
+
+def main():
+    # DCF compute is short and CPU-bound, so QPS scales with worker count.
+    # Each worker imports the app fresh, which warms the Numba kernels
+    # per process (see src/services/_dcf_kernel.py).
+    uvicorn.run(
+        'src.main:app',
+        host='0.0.0.0',
+        port=8000,
+        workers=os.cpu_count(),
+        loop='uvloop',
+        http='httptools',
+        log_level='warning',
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+from __future__ import annotations
+import numpy as np
+from numba import njit, prange
+
+
+@njit('(float64[:], float64[:], float64)', cache=True, fastmath=True)
+def _dcf_core(fcf, disc, tv):
+    """JIT-compiled DCF core.
+
+    Takes the precomputed discount-factor vector (1/(1+wacc)**k for
+    k=1..n) and returns (discounted FCFs array, PV of FCFs, discounted
+    terminal value).
+    """
+    n = fcf.shape[0]
+    out = np.empty(n)
+    s = 0.0
+    for i in range(n):
+        out[i] = fcf[i] * disc[i]
+        s += out[i]
+    dtv = tv * disc[n - 1]
+    return out, s, dtv
+
+
+@njit('(float64[:, :], float64[:], float64[:], int64[:])', parallel=True, cache=True, fastmath=True)
+def _dcf_batch(fcf_mat, waccs, tvs, years):
+    """Parallel DCF over a batch of scenarios.
+
+    `fcf_mat` is zero-padded to the longest horizon; `years[i]` gives the
+    real horizon of row i. Scenarios are distributed across cores with
+    prange. Returns (discounted FCF matrix, PV vector, discounted TV
+    vector).
+    """
+    n, k = fcf_mat.shape
+    out = np.zeros((n, k))
+    pv = np.zeros(n)
+    dtv = np.zeros(n)
+    for i in prange(n):
+        inv = 1.0 / (1.0 + waccs[i])
+        cur = 1.0
+        s = 0.0
+        for j in range(years[i]):
+            cur *= inv
+            out[i, j] = fcf_mat[i, j] * cur
+            s += out[i, j]
+        pv[i] = s
+        dtv[i] = tvs[i] * cur
+    return out, pv, dtv
+
+
+# Warm the JIT caches at import time so the first request does not pay the
+# compile cost.
+_dcf_core(np.ones(1, dtype=np.float64), np.ones(1, dtype=np.float64), 0.0)
+_dcf_batch(
+    np.ones((1, 1), dtype=np.float64),
+    np.full(1, 0.1),
+    np.zeros(1),
+    np.ones(1, dtype=np.int64),
+)
@@ -1,9 +1,26 @@
 from __future__ import annotations
-from typing import NamedTuple, List
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List
+import numpy as np
 from src.models.request import DCFRequest
+from src.services._dcf_kernel import _dcf_core, _dcf_batch
 
 
-class DCFResult(NamedTuple):
+@lru_cache(maxsize=1024)
+def _disc_factors(rate_key: int, years: int) -> np.ndarray:
+    """Discount-factor vector 1/(1+wacc)**k for k=1..years.
+
+    Keyed by the discount rate in micro-percent so the handful of
+    (rate, horizon) pairs seen in real traffic are computed once.
+    Callers must treat the returned array as read-only.
+    """
+    inv = 1.0 / (1.0 + rate_key / 1e6 / 100.0)
+    return np.cumprod(np.full(years, inv))
+
+
+@dataclass(slots=True, frozen=True)
+class DCFResult:
     enterprise_value: float
     equity_value: float
     discounted_fcfs: List[float]
@@ -29,24 +46,23 @@ class DCFCalculationService:
 
     def calculate_dcf(self, req: DCFRequest) -> DCFResult:
         # Cross-field business validation is performed in DCFRequest model validators
-        wacc = req.discount_rate / 100.0
         fcf_list = req.fcf
         if len(fcf_list) == 0:
             raise ValueError('FCF_LENGTH: fcf list must contain at least 1 item')
 
-        discounted_fcfs: List[float] = []
-        for i, fcf in enumerate(fcf_list, start=1):
-            discounted = fcf / ((1.0 + wacc) ** i)
-            discounted_fcfs.append(discounted)
-
-        pv_fcfs = sum(discounted_fcfs)
-
-        # Terminal value is computed by DCFRequest model
+        # Terminal value is computed by DCFRequest model; the kernel treats
+        # tv == 0.0 as "no terminal value".
         tv = req.terminal_value
 
-        discounted_tv = 0.0
-        if tv is not None:
-            discounted_tv = tv / ((1.0 + wacc) ** len(fcf_list))
+        # The numeric core is JIT-compiled (see _dcf_kernel) and runs at
+        # C speed; it discounts the FCFs, sums them, and discounts the TV
+        # in a single pass.
+        fcf_arr = np.asarray(fcf_list, dtype=np.float64)
+        disc = _disc_factors(int(round(req.discount_rate * 1e6)), len(fcf_list))
+        discounted_arr, pv_fcfs, discounted_tv = _dcf_core(
+            fcf_arr, disc, tv if tv is not None else 0.0
+        )
+        discounted_fcfs: List[float] = discounted_arr.tolist()
 
         enterprise_value = pv_fcfs + discounted_tv
         equity_value = enterprise_value - (req.net_debt or 0.0)
@@ -57,3 +73,37 @@ class DCFCalculationService:
             discounted_fcfs=discounted_fcfs,
             discounted_terminal_value=discounted_tv,
         )
+
+    def calculate_dcf_batch(self, reqs: List[DCFRequest]) -> List[DCFResult]:
+        """Evaluate many DCF scenarios in one parallel kernel call.
+
+        Scenarios are packed into a zero-padded FCF matrix (horizons may
+        differ) and discounted across cores by `_dcf_batch`, amortizing
+        per-request dispatch overhead for sensitivity-analysis workloads.
+        """
+        n = len(reqs)
+        if n == 0:
+            return []
+
+        years = np.array([req.years for req in reqs], dtype=np.int64)
+        k = int(years.max())
+        fcf_mat = np.zeros((n, k), dtype=np.float64)
+        waccs = np.empty(n, dtype=np.float64)
+        tvs = np.empty(n, dtype=np.float64)
+        for i, req in enumerate(reqs):
+            fcf_mat[i, :req.years] = req.fcf
+            waccs[i] = req.discount_rate / 100.0
+            tvs[i] = req.terminal_value if req.terminal_value is not None else 0.0
+
+        out, pv, dtv = _dcf_batch(fcf_mat, waccs, tvs, years)
+
+        results: List[DCFResult] = []
+        for i, req in enumerate(reqs):
+            enterprise_value = float(pv[i]) + float(dtv[i])
+            results.append(DCFResult(
+                enterprise_value=enterprise_value,
+                equity_value=enterprise_value - (req.net_debt or 0.0),
+                discounted_fcfs=out[i, :req.years].tolist(),
+                discounted_terminal_value=float(dtv[i]),
+            ))
+        return results
@@ -22,3 +22,33 @@ def test_post_dcf_calculate_basic():
     assert 'equity_value' in body
     assert 'discounted_fcfs' in body
     assert 'discounted_terminal_value' in body
+
+
+def test_post_dcf_calculate_batch_matches_single():
+    # Batch results must match the single endpoint, scenario by scenario,
+    # including mixed forecast horizons.
+    payloads = [
+        {
+            "starting_fcf": 100.0,
+            "fcf_growth_rate": 10.0,
+            "years": 3,
+            "discount_rate": 10.0,
+            "terminal_growth_rate": 2.0,
+            "net_debt": 50.0,
+        },
+        {
+            "starting_fcf": 72.764,
+            "fcf_growth_rate": 12.0,
+            "years": 10,
+            "discount_rate": 8.0,
+            "terminal_growth_rate": 3.0,
+            "net_debt": -54.3,
+        },
+    ]
+    r = client.post('/dcf/calculate_batch', json=payloads)
+    assert r.status_code == 200, r.text
+    results = r.json()
+    assert len(results) == len(payloads)
+    for payload, batch_body in zip(payloads, results):
+        single_body = client.post('/dcf/calculate', json=payload).json()
+        assert batch_body == single_body
@@ -0,0 +1,13 @@
+from src.models.response import DCFResponse
+
+
+def test_model_construct_matches_validated_dump():
+    # The API builds responses with model_construct (no validation) from
+    # trusted service output; guard that its dump matches the validated path.
+    kwargs = dict(
+        enterprise_value=1234.5678,
+        equity_value=1184.5678,
+        discounted_fcfs=[100.0, 90.909, 82.6446],
+        discounted_terminal_value=500.123,
+    )
+    assert DCFResponse.model_construct(**kwargs).model_dump() == DCFResponse(**kwargs).model_dump()